@@ -10,20 +10,23 @@ import shutil
 import signal
 import string
 import sys
-from dataclasses import dataclass
-from typing import Any, Callable, Iterable, Mapping, MutableMapping, Optional
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, MutableMapping, Optional
 
 import httpx
-import yaml
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+
+# yaml and rich are only needed for the yaml/table output formats, so they are
+# imported where used to keep startup fast for the default JSON output.
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
 DEFAULT_SERVER_URL = "http://127.0.0.1:8000"
 ENV_PREFIX = "DMX_LAN_CLI_"
 
+_VALID_CAPABILITY_KEYS = frozenset({"color", "brightness", "temperature"})
+_VALID_TEMPLATES = frozenset({"rgb", "rgbw", "brightness", "temperature"})
+
 
 class CliError(Exception):
     """Raised when the CLI encounters an expected error condition."""
@@ -50,7 +53,9 @@ def _handle_terminal_resize(signum: int, frame: Any) -> None:
     """
     Handle terminal window resize events (SIGWINCH).
 
-    Updates pagination size when auto-pagination is enabled.
+    Updates pagination size when auto-pagination is enabled. Resize events
+    arrive in bursts while a window is dragged, so the config is only
+    replaced when the page size actually changes.
 
     Args:
         signum: Signal number
@@ -62,15 +67,8 @@ def _handle_terminal_resize(signum: int, frame: Any) -> None:
         terminal_height = shutil.get_terminal_size().lines
         new_page_size = max(10, terminal_height - 2)
 
-        # Update config with new page size
-        _current_config = ClientConfig(
-            server_url=_current_config.server_url,
-            api_key=_current_config.api_key,
-            api_bearer_token=_current_config.api_bearer_token,
-            output=_current_config.output,
-            timeout=_current_config.timeout,
-            page_size=new_page_size,
-        )
+        if new_page_size != _current_config.page_size:
+            _current_config = replace(_current_config, page_size=new_page_size)
 
 
 def _env(name: str, default: Optional[str] = None) -> Optional[str]:
@@ -621,29 +619,25 @@ def _paginate_output(text: str, config: Optional[ClientConfig]) -> None:
         return
 
     lines = text.split("\n")
-    line_count = 0
-
-    for i, line in enumerate(lines):
-        sys.stdout.write(line)
-        # Only add newline if not the last line
-        if i < len(lines) - 1:
-            sys.stdout.write("\n")
-        line_count += 1
-
-        if line_count >= active_config.page_size and i < len(lines) - 1:
-            # Pause for user input
-            try:
-                response = input("\n[Press Enter to continue, 'q' to quit] ")
-                if response.lower().startswith('q'):
-                    sys.stdout.write("\n[Output truncated]\n")
-                    return
-                line_count = 0
-            except (KeyboardInterrupt, EOFError):
-                sys.stdout.write("\n[Output interrupted]\n")
+    page_size = active_config.page_size
+
+    for start in range(0, len(lines), page_size):
+        # Write each page with a single call rather than line by line
+        sys.stdout.write("\n".join(lines[start:start + page_size]) + "\n")
+
+        if start + page_size >= len(lines):
+            break
+
+        # Pause for user input
+        try:
+            response = input("\n[Press Enter to continue, 'q' to quit] ")
+            if response.lower().startswith('q'):
+                sys.stdout.write("\n[Output truncated]\n")
                 return
+        except (KeyboardInterrupt, EOFError):
+            sys.stdout.write("\n[Output interrupted]\n")
+            return
 
-    # Add single trailing newline at the end
-    sys.stdout.write('\n')
     sys.stdout.flush()
 
 
@@ -667,92 +661,93 @@ def _is_device_list(data: Any) -> bool:
     return len(device_keys & set(first_item.keys())) >= 3
 
 
+# (label, key) pairs shown on device cards, in display order
+_DEVICE_CARD_KEY_FIELDS: tuple[tuple[str, str], ...] = (
+    ("ID", "id"),
+    ("IP", "ip"),
+    ("Protocol", "protocol"),
+    ("Model", "model_number"),
+    ("Type", "device_type"),
+    ("Name", "name"),
+    ("Enabled", "enabled"),
+    ("Manual", "manual"),
+    ("Discovered", "discovered"),
+    ("Configured", "configured"),
+    ("Offline", "offline"),
+    ("Stale", "stale"),
+)
+
+_DEVICE_CARD_METADATA_FIELDS: tuple[tuple[str, str], ...] = (
+    ("LED Count", "led_count"),
+    ("Length (m)", "length_meters"),
+    ("Segments", "zone_count"),
+    ("Last Seen", "last_seen"),
+    ("First Seen", "first_seen"),
+)
+
+
+# Pre-rendered markup for boolean device flags
+_BOOL_MARKUP: Mapping[bool, str] = {
+    True: "[green]✓[/green]",
+    False: "[red]✗[/red]",
+}
+
+_DEVICE_CARD_SEPARATOR = "─" * 80
+
+
 def _print_device_cards(devices: list[dict[str, Any]], console: Console, config: Optional[ClientConfig]) -> None:
     """
     Print devices in a card-style format with multiple lines per device.
 
+    All cards are rendered into a single console capture and written
+    through _paginate_output in one pass.
+
     Args:
         devices: List of device dictionaries
         console: Rich console instance
         config: Client configuration (for pagination)
     """
-    line_count = 0
-
-    for idx, device in enumerate(devices):
-        # Create a table for this device with 2 columns
-        table = Table(show_header=False, box=None, padding=(0, 1))
-        table.add_column("Field", style="cyan", width=20)
-        table.add_column("Value", style="yellow")
-
-        # Key fields to display in order
-        key_fields = [
-            ("ID", "id"),
-            ("IP", "ip"),
-            ("Protocol", "protocol"),
-            ("Model", "model_number"),
-            ("Type", "device_type"),
-            ("Name", "name"),
-            ("Enabled", "enabled"),
-            ("Manual", "manual"),
-            ("Discovered", "discovered"),
-            ("Configured", "configured"),
-            ("Offline", "offline"),
-            ("Stale", "stale"),
-        ]
-
-        # Add key fields
-        for label, key in key_fields:
-            if key in device and device[key] is not None:
-                value = device[key]
-                if isinstance(value, bool):
-                    value_str = "✓" if value else "✗"
-                    style = "green" if value else "red"
-                    table.add_row(label, f"[{style}]{value_str}[/{style}]")
-                else:
+    from rich.table import Table
+
+    with console.capture() as capture:
+        for idx, device in enumerate(devices):
+            # Create a table for this device with 2 columns
+            table = Table(show_header=False, box=None, padding=(0, 1))
+            table.add_column("Field", style="cyan", width=20)
+            table.add_column("Value", style="yellow")
+
+            # Add key fields
+            for label, key in _DEVICE_CARD_KEY_FIELDS:
+                value = device.get(key)
+                if value is not None:
+                    if isinstance(value, bool):
+                        table.add_row(label, _BOOL_MARKUP[value])
+                    else:
+                        table.add_row(label, str(value))
+
+            # Add capabilities as JSON if present
+            capabilities = device.get("capabilities")
+            if capabilities:
+                caps_str = json.dumps(capabilities, indent=2) if isinstance(capabilities, dict) else str(capabilities)
+                table.add_row("Capabilities", caps_str)
+
+            # Add metadata fields if present
+            for label, key in _DEVICE_CARD_METADATA_FIELDS:
+                value = device.get(key)
+                if value is not None:
                     table.add_row(label, str(value))
 
-        # Add capabilities as JSON if present
-        if "capabilities" in device and device["capabilities"]:
-            caps_str = json.dumps(device["capabilities"], indent=2) if isinstance(device["capabilities"], dict) else str(device["capabilities"])
-            table.add_row("Capabilities", caps_str)
-
-        # Add metadata fields if present
-        metadata_fields = [
-            ("LED Count", "led_count"),
-            ("Length (m)", "length_meters"),
-            ("Segments", "zone_count"),
-            ("Last Seen", "last_seen"),
-            ("First Seen", "first_seen"),
-        ]
+            # Print device header and table
+            header_text = f"[bold magenta]Device {idx + 1} of {len(devices)}[/bold magenta]"
+            console.print(header_text)
+            console.print(table)
 
-        for label, key in metadata_fields:
-            if key in device and device[key] is not None:
-                table.add_row(label, str(device[key]))
+            # Add separator between devices
+            if idx < len(devices) - 1:
+                console.print(_DEVICE_CARD_SEPARATOR)
 
-        # Print device header and table
-        header_text = f"[bold magenta]Device {idx + 1} of {len(devices)}[/bold magenta]"
-        console.print(header_text)
-        console.print(table)
-
-        # Add separator between devices
-        if idx < len(devices) - 1:
-            console.print("─" * 80)
-
-        # Count lines for pagination (rough estimate: 2 lines per field + header + separator)
-        estimated_lines = len([r for r in table.rows]) + 3
-        line_count += estimated_lines
-
-        # Check if we need to pause
-        if config and config.page_size and line_count >= config.page_size and idx < len(devices) - 1:
-            try:
-                response = input("\n[Press Enter to continue, 'q' to quit] ")
-                if response.lower().startswith('q'):
-                    console.print("\n[dim][Output truncated][/dim]")
-                    return
-                line_count = 0
-            except (KeyboardInterrupt, EOFError):
-                console.print("\n[dim][Output interrupted][/dim]")
-                return
+    # Page the rendered cards by actual output lines
+    _paginate_output(capture.get(), config)
 
 
 def _print_output(data: Any, output: str, config: Optional[ClientConfig] = None) -> None:
@@ -765,11 +760,15 @@ def _print_output(data: Any, output: str, config: Optional[ClientConfig] = None)
         config: Client configuration (for pagination)
     """
     if output == "yaml":
+        import yaml
+
         stream = io.StringIO()
         yaml.safe_dump(data, stream, sort_keys=False)
         output_text = stream.getvalue()
         _paginate_output(output_text, config)
     elif output == "table":
+        from rich.console import Console
+
         console = Console()
         _print_table(data, console, config)
     else:
@@ -795,6 +794,9 @@ def _print_table(data: Any, console: Console, config: Optional[ClientConfig] = N
         _print_device_cards(data, console, config)
         return
 
+    # Only the generic list/dict renderers below need Table
+    from rich.table import Table
+
     # Handle list of items (most common case)
     if isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict):
         table = Table(show_header=True, header_style="bold magenta")
@@ -1166,11 +1168,10 @@ def _validate_capabilities(capabilities: Any) -> dict[str, Any]:
     if not isinstance(capabilities, dict):
         raise CliError("Capabilities must be a JSON object (dictionary)")
 
-    valid_keys = {"color", "brightness", "temperature"}
     for key in capabilities.keys():
-        if key not in valid_keys:
+        if key not in _VALID_CAPABILITY_KEYS:
             raise CliError(
-                f"Invalid capability key '{key}'. Valid keys: {', '.join(sorted(valid_keys))}"
+                f"Invalid capability key '{key}'. Valid keys: {', '.join(sorted(_VALID_CAPABILITY_KEYS))}"
             )
 
     for key, value in capabilities.items():
@@ -1274,11 +1275,10 @@ def _validate_mapping_payload(payload: dict[str, Any], operation: str = "create"
 
     # Validate template if present
     if "template" in payload:
-        valid_templates = {"rgb", "rgbw", "brightness", "temperature"}
         template = payload["template"]
-        if template not in valid_templates:
+        if template not in _VALID_TEMPLATES:
             raise CliError(
-                f"Invalid template '{template}'. Valid templates: {', '.join(sorted(valid_templates))}"
+                f"Invalid template '{template}'. Valid templates: {', '.join(sorted(_VALID_TEMPLATES))}"
             )
 
 
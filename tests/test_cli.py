@@ -1,10 +1,13 @@
 import json
+import os
+import shutil
 from argparse import Namespace
 from typing import Any
 
 import httpx
 import pytest
 
+from dmx_lan_bridge import cli
 from dmx_lan_bridge.cli import (
     CliError,
     ClientConfig,
@@ -88,3 +91,63 @@ def test_cli_device_command_payload_and_url() -> None:
         "color": "0f0f0f",
         "kelvin": 128,
     }
+
+
+def test_terminal_resize_updates_page_size_only_on_change(monkeypatch: pytest.MonkeyPatch) -> None:
+    config = ClientConfig(
+        server_url="http://test", api_key="key", api_bearer_token=None, output="json", page_size=38
+    )
+    monkeypatch.setattr(cli, "_auto_pagination", True)
+    monkeypatch.setattr(cli, "_current_config", config)
+    monkeypatch.setattr(shutil, "get_terminal_size", lambda: os.terminal_size((80, 40)))
+
+    cli._handle_terminal_resize(0, None)
+    assert cli._current_config is config
+
+    monkeypatch.setattr(shutil, "get_terminal_size", lambda: os.terminal_size((80, 50)))
+    cli._handle_terminal_resize(0, None)
+    assert cli._current_config.page_size == 48
+    assert cli._current_config.api_key == "key"
+    assert cli._current_config.server_url == "http://test"
+
+
+def test_device_cards_render_through_single_paginated_write(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    from rich.console import Console
+
+    monkeypatch.setattr(cli, "_current_config", None)
+    config = ClientConfig(server_url="http://test", api_key=None, api_bearer_token=None, output="table")
+    devices = [
+        {"id": "AA:BB", "ip": "192.168.1.10", "enabled": True, "capabilities": {"color": True}},
+        {"id": "CC:DD", "ip": "192.168.1.11", "enabled": False, "capabilities": {"color": False}},
+    ]
+
+    cli._print_device_cards(devices, Console(color_system=None), config)
+
+    out = capsys.readouterr().out
+    assert "Device 1 of 2" in out
+    assert "Device 2 of 2" in out
+    assert out.index("AA:BB") < out.index("CC:DD")
+    assert out.endswith("\n") and not out.endswith("\n\n")
+
+
+def test_paginate_output_writes_pages_and_honours_quit(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    config = ClientConfig(
+        server_url="http://test", api_key=None, api_bearer_token=None, output="json", page_size=2
+    )
+    monkeypatch.setattr(cli, "_current_config", None)
+
+    responses = iter(["", ""])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(responses))
+    cli._paginate_output("a\nb\nc\nd\ne\n\n", config)
+    assert capsys.readouterr().out == "a\nb\nc\nd\ne\n"
+
+    monkeypatch.setattr("builtins.input", lambda prompt="": "q")
+    cli._paginate_output("a\nb\nc\nd\ne", config)
+    assert capsys.readouterr().out == "a\nb\n\n[Output truncated]\n"
+
+    cli._paginate_output("a\nb", config)
+    assert capsys.readouterr().out == "a\nb\n"